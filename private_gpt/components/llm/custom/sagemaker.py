@@ -23,8 +23,6 @@ from llama_index.llms.generic_utils import (
 )
 from llama_index.llms.llama_utils import (
     completion_to_prompt as generic_completion_to_prompt,
-)
-from llama_index.llms.llama_utils import (
     messages_to_prompt as generic_messages_to_prompt,
 )
 
@@ -79,9 +79,13 @@ class VectorStoreComponent:
                         "Trying to connect to Qdrant at localhost:6333."
                     )
                     client = QdrantClient()
+                elif settings.qdrant.mode == "memory":
+                    client = QdrantClient(location=":memory:")
                 else:
                     client = QdrantClient(
-                        **settings.qdrant.model_dump(exclude_none=True)
+                        **settings.qdrant.model_dump(
+                            exclude={"mode"}, exclude_none=True
+                        )
                     )
                 self.vector_store = typing.cast(
                     VectorStore,
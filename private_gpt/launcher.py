@@ -109,11 +109,12 @@ def create_app(root_injector: Injector) -> FastAPI:
         settings = root_injector.get(Settings)
         if settings.server.cors.enabled:
             logger.debug("Setting up CORS middleware")
+            origin_regex = settings.server.cors.compiled_origin_regex
             app.add_middleware(
                 CORSMiddleware,
                 allow_credentials=settings.server.cors.allow_credentials,
                 allow_origins=settings.server.cors.allow_origins,
-                allow_origin_regex=settings.server.cors.allow_origin_regex,
+                allow_origin_regex=origin_regex.pattern if origin_regex else None,
                 allow_methods=settings.server.cors.allow_methods,
                 allow_headers=settings.server.cors.allow_headers,
             )
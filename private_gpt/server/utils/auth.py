@@ -25,7 +25,7 @@ from fastapi import Depends, Header, HTTPException
 
 from private_gpt.di import global_injector
 from private_gpt.server.utils.user import User
-from private_gpt.settings.settings import settings
+from private_gpt.settings.settings import settings, view
 
 # 401 signify that the request requires authentication.
 # 403 signify that the authenticated user is not authorized to perform the operation.
@@ -40,7 +40,7 @@ logger = logging.getLogger(__name__)
 
 def _simple_authentication(authorization: Annotated[str, Header()] = "") -> User:
     """Check if the request is authenticated."""
-    if not secrets.compare_digest(authorization, settings().server.basic_auth.secret):
+    if not secrets.compare_digest(authorization, view().basic_auth_secret):
         # If the "Authorization" header is not the expected one, raise an exception.
         raise NOT_AUTHENTICATED
     return User(sub="basic_user", allowed_ingest=True)
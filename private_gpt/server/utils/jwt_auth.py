@@ -5,7 +5,7 @@ from fastapi import HTTPException
 from jwt import PyJWKClient
 
 from private_gpt.server.utils.user import User
-from private_gpt.settings.settings import settings
+from private_gpt.settings.settings import settings, view
 
 
 def _parse_token(authorization: str) -> str:
@@ -35,21 +35,20 @@ class JWTAuth:
         try:
             token = _parse_token(authorization)
             signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+            settings_view = view()
             data = jwt.decode(
                 token,
                 signing_key.key,
                 algorithms=["RS256"],
-                audience=settings().server.jwt_auth.audience,
+                audience=settings_view.jwt_audience,
                 options={
-                    "require": ["exp", "iss", settings().server.jwt_auth.user_id_claim],
+                    "require": ["exp", "iss", settings_view.jwt_user_id_claim],
                     "verify_signature": True,
                 },
             )
             return User(
-                sub=data[settings().server.jwt_auth.user_id_claim],
-                allowed_ingest=bool(
-                    data.get(settings().server.jwt_auth.ingest_claim, False)
-                ),
+                sub=data[settings_view.jwt_user_id_claim],
+                allowed_ingest=bool(data.get(settings_view.jwt_ingest_claim, False)),
             )
         except Exception as e:
             logging.error(e)
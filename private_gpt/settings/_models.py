@@ -0,0 +1,539 @@
+"""Settings models, imported lazily by `private_gpt.settings.settings`."""
+import functools
+import os
+import re
+import types
+from collections.abc import Callable
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# Settings are read-only once loaded
+_CFG = ConfigDict(frozen=True, extra="ignore")
+
+
+class CorsSettings(BaseModel):
+    """CORS configuration.
+
+    For more details on the CORS configuration, see:
+    # * https://fastapi.tiangolo.com/tutorial/cors/
+    # * https://developer.mozilla.org/en-US/docs/Web/HTTP/CORS
+    """
+
+    model_config = _CFG
+
+    enabled: bool = Field(
+        description="Flag indicating if CORS headers are set or not."
+        "If set to True, the CORS headers will be set to allow all origins, methods and headers.",
+        default=False,
+    )
+    allow_credentials: bool = Field(
+        description="Indicate that cookies should be supported for cross-origin requests",
+        default=False,
+    )
+    allow_origins: tuple[str, ...] = Field(
+        description="A list of origins that should be permitted to make cross-origin requests.",
+        default=(),
+    )
+    allow_origin_regex: tuple[str, ...] | None = Field(
+        description="A regex string to match against origins that should be permitted to make cross-origin requests.",
+        default=None,
+    )
+    allow_methods: tuple[str, ...] = Field(
+        description="A list of HTTP methods that should be allowed for cross-origin requests.",
+        default=("GET",),
+    )
+    allow_headers: tuple[str, ...] = Field(
+        description="A list of HTTP request headers that should be supported for cross-origin requests.",
+        default=(),
+    )
+
+    @property
+    def compiled_origin_regex(self) -> re.Pattern[str] | None:
+        """Single pattern matching any of `allow_origin_regex`, compiled once."""
+        return _compile_origin_regex(self.allow_origin_regex)
+
+
+@functools.cache
+def _compile_origin_regex(patterns: tuple[str, ...] | None) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+class BasicAuthSettings(BaseModel):
+    """Authentication configuration.
+
+    The implementation of the authentication strategy must
+    """
+
+    model_config = _CFG
+
+    enabled: bool = Field(
+        description="Flag indicating if authentication is enabled or not.",
+        default=False,
+    )
+    secret: str = Field(
+        description="The secret to be used for authentication. "
+        "It can be any non-blank string. For HTTP basic authentication, "
+        "this value should be the whole 'Authorization' header that is expected"
+    )
+
+
+class JWTAuthSettings(BaseModel):
+    """Authentication configuration for JWT.
+
+    The implementation of the authentication strategy for JWT
+    """
+
+    model_config = _CFG
+
+    enabled: bool = Field(
+        description="Flag indicating if authentication is enabled or not.",
+        default=False,
+    )
+    jwks_url: str = Field(description="The url to download JWKs from for verification")
+    ingest_claim: str = Field(
+        description="The JWT claim to use to determine if allowed to ingest",
+        default="ingest",
+    )
+    user_id_claim: str = Field(
+        description="The JWT claim to use to determine the user_id",
+        default="sub",
+    )
+    audience: str = Field(
+        description="The intended audience of the JWT", default="privateGPT"
+    )
+
+
+class ServerSettings(BaseModel):
+    model_config = _CFG
+
+    env_name: str = Field(
+        description="Name of the environment (prod, staging, local...)"
+    )
+    port: int = Field(description="Port of PrivateGPT FastAPI server, defaults to 8001")
+    cors: CorsSettings = Field(
+        description="CORS configuration", default=CorsSettings(enabled=False)
+    )
+    basic_auth: BasicAuthSettings = Field(
+        description="Authentication configuration",
+        default_factory=lambda: BasicAuthSettings(enabled=False, secret="secret-key"),
+    )
+
+    jwt_auth: JWTAuthSettings = Field(
+        description="JWT AUTh configuration",
+        default_factory=lambda: JWTAuthSettings(
+            enabled=False, jwks_url="https://example.com/.well-known/jwks.json"
+        ),
+    )
+
+
+class DataSettings(BaseModel):
+    model_config = _CFG
+
+    local_data_folder: str = Field(
+        description="Path to local storage."
+        "It will be treated as an absolute path if it starts with /"
+    )
+
+
+class LLMSettings(BaseModel):
+    model_config = _CFG
+
+    mode: Literal["local", "openai", "sagemaker", "mock"]
+
+
+class VectorstoreSettings(BaseModel):
+    model_config = _CFG
+
+    database: Literal["chroma", "qdrant"]
+    collection_name: str = Field(
+        description="collection name to use in the vector store", default="privateGPT"
+    )
+
+
+class RedisSettings(BaseModel):
+    model_config = _CFG
+
+    host: str = Field(description="Redis host", default="redis")
+    port: int = Field(description="Redis port", default=6379)
+
+
+class DynamoDBSettings(BaseModel):
+    model_config = _CFG
+
+    table_name: str = Field(description="Dynamodb Table name", default="dummy_table")
+
+
+class _KVStoreSettings(BaseModel):
+    model_config = _CFG
+
+    database: Literal["disk", "redis", "dynamodb"] = Field(default="disk")
+    namespace: str = Field(description="Namespace to store the data in")
+    redis: RedisSettings = Field(
+        description="The redis connection settings",
+        default_factory=RedisSettings,
+    )
+    dynamodb: DynamoDBSettings = Field(
+        description="The dynamodb settings",
+        default_factory=DynamoDBSettings,
+    )
+
+
+class DocumentstoreSettings(_KVStoreSettings):
+    namespace: str = Field(
+        description="Namespace to store the document store in",
+        default="private_gpt_documents",
+    )
+
+
+class IndexstoreSettings(_KVStoreSettings):
+    namespace: str = Field(
+        description="Namespace to store the index store in", default="private_gpt_index"
+    )
+
+
+class LocalSettings(BaseModel):
+    model_config = _CFG
+
+    llm_hf_repo_id: str
+    llm_hf_model_file: str
+    embedding_hf_model_name: str
+
+
+class SagemakerSettings(BaseModel):
+    model_config = _CFG
+
+    llm_endpoint_name: str
+    embedding_endpoint_name: str
+
+
+class OpenAISettings(BaseModel):
+    model_config = _CFG
+
+    api_key: str
+
+
+class UISettings(BaseModel):
+    model_config = _CFG
+
+    enabled: bool
+    path: str
+
+
+class QdrantMemory(BaseModel):
+    """In-memory Qdrant instance."""
+
+    model_config = _CFG
+
+    mode: Literal["memory"] = "memory"
+
+
+class QdrantLocal(BaseModel):
+    """Disk-based Qdrant instance, running in process."""
+
+    model_config = _CFG
+
+    mode: Literal["local"] = "local"
+    path: str = Field(description="Persistence path for QdrantLocal.")
+    force_disable_check_same_thread: bool = Field(
+        True,
+        description=(
+            "For QdrantLocal, force disable check_same_thread. Default: `True`"
+            "Only use this if you can guarantee that you can resolve the thread safety outside QdrantClient."
+        ),
+    )
+
+
+class QdrantRemote(BaseModel):
+    """Qdrant server or Qdrant Cloud instance.
+
+    Fields left as `None` are not passed to the Qdrant client, each of them has a
+    client-side behavior that no default value reproduces.
+    """
+
+    model_config = _CFG
+
+    mode: Literal["remote"] = "remote"
+    location: str | None = Field(
+        None,
+        description="URL of the Qdrant instance, used as a `url` parameter.",
+    )
+    url: str | None = Field(
+        None,
+        description=(
+            "Either host or str of 'Optional[scheme], host, Optional[port], Optional[prefix]'."
+        ),
+    )
+    host: str | None = Field(
+        None,
+        description="Host name of Qdrant service. If url and host are None, set to 'localhost'.",
+    )
+    port: int = Field(6333, description="Port of the REST API interface.")
+    grpc_port: int = Field(6334, description="Port of the gRPC interface.")
+    prefer_grpc: bool = Field(
+        False,
+        description="If `true` - use gRPC interface whenever possible in custom methods.",
+    )
+    https: bool | None = Field(
+        None,
+        description="If `true` - use HTTPS(SSL) protocol. If not set, HTTPS is used when `api_key` is set.",
+    )
+    api_key: str | None = Field(
+        None,
+        description="API key for authentication in Qdrant Cloud.",
+    )
+    prefix: str | None = Field(
+        None,
+        description=(
+            "Prefix to add to the REST URL path."
+            "Example: `service/v1` will result in "
+            "'http://localhost:6333/service/v1/{qdrant-endpoint}' for REST API."
+        ),
+    )
+    timeout: float | None = Field(
+        None,
+        description="Timeout for REST and gRPC API requests. If not set, 5 seconds for REST and unlimited for gRPC.",
+    )
+
+
+def _qdrant_mode(value: Any) -> str | None:
+    """Get the Qdrant mode, inferring it from the other keys when not set."""
+    if isinstance(value, QdrantMemory | QdrantLocal | QdrantRemote):
+        return value.mode
+    if not isinstance(value, dict):
+        # Let pydantic report the invalid value
+        return None
+    if "mode" in value:
+        return str(value["mode"])
+    # Same precedence as QdrantClient: `:memory:` wins over `path`
+    if value.get("location") == ":memory:":
+        return "memory"
+    if value.get("path") is not None:
+        return "local"
+    return "remote"
+
+
+QdrantSettings = Annotated[
+    Annotated[QdrantMemory, Tag("memory")]
+    | Annotated[QdrantLocal, Tag("local")]
+    | Annotated[QdrantRemote, Tag("remote")],
+    Discriminator(_qdrant_mode),
+]
+
+
+class Settings(BaseModel):
+    model_config = _CFG
+
+    server: ServerSettings
+    data: DataSettings
+    ui: UISettings
+    llm: LLMSettings
+    local: LocalSettings
+    sagemaker: SagemakerSettings
+    openai: OpenAISettings
+    vectorstore: VectorstoreSettings
+    indexstore: IndexstoreSettings
+    documentstore: DocumentstoreSettings
+    qdrant: QdrantSettings | None = None
+
+
+"""
+Validator of raw settings dicts, built once and shared by every caller.
+"""
+SETTINGS_ADAPTER: TypeAdapter[Settings] = TypeAdapter(Settings)
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _model_type(annotation: Any) -> type[BaseModel] | None:
+    """Return the model class of a `Model` or `Model | None` annotation."""
+    annotation = _strip_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _tagged_models(
+    annotation: Any,
+) -> tuple[Callable[[Any], str], dict[str, type[BaseModel]]] | None:
+    """Return the discriminator and the models by tag of a tagged union annotation."""
+    annotation = _strip_optional(annotation)
+    if get_origin(annotation) is not Annotated:
+        return None
+    union, *metadata = get_args(annotation)
+    discriminator = next((m for m in metadata if isinstance(m, Discriminator)), None)
+    if discriminator is None or not callable(discriminator.discriminator):
+        return None
+    models = {}
+    for member in get_args(union):
+        model, *member_metadata = get_args(member)
+        tag = next(m for m in member_metadata if isinstance(m, Tag))
+        models[tag.tag] = model
+    return discriminator.discriminator, models  # type: ignore[return-value]
+
+
+def _tag_field(model_cls: type[BaseModel], tag: str) -> str:
+    """Return the name of the `Literal[tag]` field identifying a tagged union member."""
+    return next(
+        name
+        for name, field in model_cls.model_fields.items()
+        if get_origin(field.annotation) is Literal
+        and get_args(field.annotation) == (tag,)
+    )
+
+
+def _field_model(annotation: Any, value: Any) -> type[BaseModel] | None:
+    """Return the model a parsed `value` of a field should be built as."""
+    if not isinstance(value, dict):
+        return None
+    tagged = _tagged_models(annotation)
+    if tagged is not None:
+        discriminator, models = tagged
+        return models.get(discriminator(value))  # type: ignore[arg-type]
+    return _model_type(annotation)
+
+
+def _construct(model_cls: type[_M], data: dict[str, Any]) -> _M:
+    """Build `model_cls` from already parsed data, skipping validation.
+
+    Nested models are constructed recursively, missing fields take their defaults.
+    """
+    values: dict[str, Any] = {}
+    for name, field in model_cls.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        sub_model = _field_model(field.annotation, value)
+        if sub_model is not None:
+            value = _construct(sub_model, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def _struct_type(annotation: Any) -> Any:
+    """Translate a settings field annotation to its msgspec equivalent."""
+    optional = _strip_optional(annotation) is not annotation
+    tagged = _tagged_models(annotation)
+    if tagged is not None:
+        _, models = tagged
+        struct = Union[  # type: ignore[valid-type]  # noqa: UP007
+            tuple(_struct_mirror(model, tag) for tag, model in models.items())
+        ]
+    else:
+        model = _model_type(annotation)
+        if model is None:
+            return annotation
+        struct = _struct_mirror(model)
+    return struct | None if optional else struct
+
+
+def _struct_field(field: FieldInfo, annotation: Any) -> Any:
+    import msgspec
+
+    if field.default_factory is None:
+        if field.default is PydanticUndefined:
+            return msgspec.NODEFAULT
+        if not isinstance(field.default, BaseModel | list | dict):
+            return field.default
+    factory = field.default_factory or (lambda: field.default)
+
+    def default() -> Any:
+        value = factory()
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        return msgspec.convert(value, type=annotation, strict=False)
+
+    return msgspec.field(default_factory=default)
+
+
+@functools.cache
+def _struct_mirror(model_cls: type[BaseModel], tag: str | None = None) -> Any:
+    """Build a `msgspec.Struct` mirroring the fields of a settings model.
+
+    Members of tagged unions carry their tag as a msgspec tag field.
+    """
+    import msgspec
+
+    tag_field = _tag_field(model_cls, tag) if tag is not None else None
+    fields = []
+    for name, field in model_cls.model_fields.items():
+        if name == tag_field:
+            continue
+        annotation = _struct_type(field.annotation)
+        fields.append((name, annotation, _struct_field(field, annotation)))
+
+    def to_pydantic(self: msgspec.Struct) -> BaseModel:
+        return _construct(model_cls, msgspec.to_builtins(self))
+
+    return msgspec.defstruct(
+        f"{model_cls.__name__}Struct",
+        fields,
+        kw_only=True,
+        frozen=True,
+        tag_field=tag_field,
+        tag=tag,
+        namespace={"to_pydantic": to_pydantic},
+    )
+
+
+def _with_tags(model_cls: type[BaseModel], data: dict[str, Any]) -> dict[str, Any]:
+    """Add the tag of every tagged union member found in the parsed data.
+
+    msgspec needs the tag to be present, while the settings files may let the
+    pydantic discriminator infer it.
+    """
+    values = dict(data)
+    for name, field in model_cls.model_fields.items():
+        value = values.get(name)
+        sub_model = _field_model(field.annotation, value)
+        if sub_model is None:
+            continue
+        value = _with_tags(sub_model, value)  # type: ignore[arg-type]
+        tagged = _tagged_models(field.annotation)
+        if tagged is not None:
+            tag = tagged[0](value)
+            value[_tag_field(sub_model, tag)] = tag
+        values[name] = value
+    return values
+
+
+def _fast_typed(data: dict[str, Any]) -> Settings:
+    """Validate the settings with msgspec, then build the pydantic models from it."""
+    try:
+        import msgspec
+    except ImportError as e:
+        raise ImportError(
+            "'msgspec' is not installed."
+            "To use PGPT_FAST_SETTINGS, install the 'fast-settings' extra."
+            "`poetry install --extras fast-settings`"
+        ) from e
+
+    settings_struct = _struct_mirror(Settings)
+    data = _with_tags(Settings, data)
+    return msgspec.convert(data, type=settings_struct, strict=False).to_pydantic()  # type: ignore[no-any-return]
+
+
+def build_settings(data: dict[str, Any]) -> Settings:
+    """Build the typed settings from the merged settings dict."""
+    if os.environ.get("PGPT_FAST_SETTINGS") == "1":
+        return _fast_typed(data)
+    return SETTINGS_ADAPTER.validate_python(data)
@@ -40,8 +40,8 @@ def load_settings_from_profile(profile: str) -> dict[str, Any]:
         profile_file_name = f"settings-{profile}.yaml"
 
     path = Path(_settings_folder) / profile_file_name
-    with Path(path).open("r") as f:
-        config = load_yaml_with_envvars(f)
+    # Read the whole file at once and parse it from memory
+    config = load_yaml_with_envvars(path.read_bytes())
     if not isinstance(config, dict):
         raise TypeError(f"Config file has no top-level mapping: {path}")
     return config
@@ -3,16 +3,20 @@ import re
 import typing
 from typing import Any, TextIO
 
-from yaml import SafeLoader
+try:
+    # libyaml based loader, much faster than the pure python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 _env_replace_matcher = re.compile(r"\$\{(\w|_)+:?.*}")
 
 
 @typing.no_type_check  # pyaml does not have good hints, everything is Any
 def load_yaml_with_envvars(
-    stream: TextIO, environ: dict[str, Any] = os.environ
+    stream: TextIO | str | bytes, environ: dict[str, Any] = os.environ
 ) -> dict[str, Any]:
-    """Load yaml file with environment variable expansion.
+    """Load yaml file, or its already read content, with environment variable expansion.
 
     The pattern ${VAR} or ${VAR:default} will be replaced with
     the value of the environment variable.
@@ -6,7 +6,11 @@ import pytest
 from injector import Provider, ScopeDecorator, singleton
 
 from private_gpt.di import create_application_injector
-from private_gpt.settings.settings import Settings, unsafe_settings
+from private_gpt.settings.settings import (
+    SETTINGS_ADAPTER,
+    Settings,
+    unsafe_settings,
+)
 from private_gpt.settings.settings_loader import merge_settings
 from private_gpt.utils.typing import T
 
@@ -29,7 +33,7 @@ class MockInjector:
 
     def bind_settings(self, settings: dict[str, Any]) -> Settings:
         merged = merge_settings([unsafe_settings, settings])
-        new_settings = Settings(**merged)
+        new_settings = SETTINGS_ADAPTER.validate_python(merged)
         self.test_injector.binder.bind(Settings, new_settings)
         return new_settings
 
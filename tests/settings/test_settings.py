@@ -1,4 +1,25 @@
-from private_gpt.settings.settings import Settings, settings
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from private_gpt.di import global_injector
+from private_gpt.settings._models import _construct, _fast_typed
+from private_gpt.settings.settings import (
+    SETTINGS_ADAPTER,
+    CorsSettings,
+    QdrantLocal,
+    QdrantMemory,
+    QdrantRemote,
+    QdrantSettings,
+    RedisSettings,
+    ServerSettings,
+    Settings,
+    settings,
+    unsafe_settings,
+    view,
+)
+from private_gpt.settings.settings_loader import merge_settings
 from tests.fixtures.mock_injector import MockInjector
 
 
@@ -10,3 +31,105 @@ def test_settings_can_be_overriden(injector: MockInjector) -> None:
     injector.bind_settings({"server": {"env_name": "overriden"}})
     mocked_settings = injector.get(Settings)
     assert mocked_settings.server.env_name == "overriden"
+
+
+def test_qdrant_mode_is_inferred_when_not_set() -> None:
+    adapter = TypeAdapter(QdrantSettings)
+    assert isinstance(adapter.validate_python({"path": "qdrant"}), QdrantLocal)
+    assert isinstance(adapter.validate_python({"location": ":memory:"}), QdrantMemory)
+    assert isinstance(
+        adapter.validate_python({"path": "qdrant", "location": ":memory:"}),
+        QdrantMemory,
+    )
+    assert isinstance(adapter.validate_python({"url": "http://qdrant"}), QdrantRemote)
+    assert isinstance(
+        adapter.validate_python({"mode": "memory", "path": "qdrant"}), QdrantMemory
+    )
+    for invalid in ("qdrant", ["qdrant"]):
+        with pytest.raises(ValidationError):
+            adapter.validate_python(invalid)
+
+
+def test_construct_builds_nested_models() -> None:
+    server = _construct(
+        ServerSettings,
+        {"env_name": "constructed", "port": 8001, "cors": {"enabled": True}},
+    )
+    assert server.port == 8001
+    assert isinstance(server.cors, CorsSettings)
+    assert server.cors.enabled
+    # Missing fields fall back to their defaults
+    assert server.cors.allow_methods == ("GET",)
+    assert not server.basic_auth.enabled
+
+    indexstore = _construct(Settings, {"indexstore": {"database": "redis"}}).indexstore
+    assert indexstore.database == "redis"
+    assert indexstore.namespace == "private_gpt_index"
+    assert indexstore.redis == RedisSettings()
+
+
+def test_construct_builds_tagged_qdrant_member() -> None:
+    local = _construct(Settings, {"qdrant": {"path": "qdrant"}}).qdrant
+    assert isinstance(local, QdrantLocal)
+    assert local.force_disable_check_same_thread
+
+    remote = _construct(Settings, {"qdrant": {"mode": "remote", "url": "u"}}).qdrant
+    assert isinstance(remote, QdrantRemote)
+    assert remote.port == 6333
+
+    assert _construct(Settings, {"qdrant": None}).qdrant is None
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        # Environment variables expansion produces strings
+        {"server": {"port": "8001"}, "ui": {"enabled": "false"}},
+        {"qdrant": {"mode": "memory"}},
+        {"qdrant": {"mode": "remote", "url": "http://qdrant", "https": "true"}},
+        {"qdrant": None},
+    ],
+)
+def test_fast_settings_match_pydantic_validation(overrides: dict[str, Any]) -> None:
+    pytest.importorskip("msgspec")
+    data = merge_settings([unsafe_settings, overrides])
+    assert _fast_typed(data) == SETTINGS_ADAPTER.validate_python(data)
+
+
+def test_view_follows_settings_cache_clear() -> None:
+    original = settings()
+    assert view().basic_auth_secret == original.server.basic_auth.secret
+
+    rebound = SETTINGS_ADAPTER.validate_python(
+        merge_settings(
+            [unsafe_settings, {"server": {"basic_auth": {"secret": "rebound"}}}]
+        )
+    )
+    global_injector.binder.bind(Settings, to=rebound)
+    try:
+        settings.cache_clear()
+        assert view().basic_auth_secret == "rebound"
+    finally:
+        global_injector.binder.bind(Settings, to=original)
+        settings.cache_clear()
+    assert view().basic_auth_secret == original.server.basic_auth.secret
+
+
+def test_cors_origin_regexes_are_compiled_into_a_single_pattern() -> None:
+    patterns = [r"https://.*\.example\.com", "http://localhost"]
+    cors = CorsSettings(allow_origin_regex=patterns)
+    other = CorsSettings(allow_origin_regex=patterns)
+    hash_before = hash(cors)
+
+    pattern = cors.compiled_origin_regex
+    assert pattern is not None
+    assert pattern.fullmatch("https://app.example.com")
+    assert pattern.fullmatch("http://localhost")
+    assert not pattern.fullmatch("http://localhost.evil.com")
+    assert CorsSettings().compiled_origin_regex is None
+
+    # Compiling the pattern does not change the model
+    assert cors == other
+    assert hash(cors) == hash_before == hash(other)
+    assert "compiled_origin_regex" not in cors.model_dump()